@@ -1,7 +1,9 @@
 import networkx as nx
-from community import community_louvain
+import igraph as ig
+import numba
 from joblib import Parallel, delayed
 import numpy as np
+from scipy.sparse.csgraph import connected_components
 import uuid
 import matplotlib.pyplot as plt
 import os
@@ -9,9 +11,147 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from collections import Counter
 
+from .utils import graph_adjacency, graph_degrees
+
+PARALLEL_BETWEENNESS_MIN_NODES = 5000
+NUMBA_CLOSENESS_MIN_NODES = 500
+
+
+def _betweenness_from_sources(G, sources):
+    nodes = list(G)
+    betweenness = nx.betweenness_centrality_subset(G, sources=sources, targets=nodes, normalized=False)
+    return np.fromiter((betweenness[node] for node in nodes), dtype=np.float64, count=len(nodes))
+
+
+def compute_betweenness_centrality(G, normalized=True, n_jobs=None, chunk_size=None):
+    """
+    Exact betweenness centrality with the Brandes source loop split across processes.
+    Every worker runs single-source shortest paths on the whole graph for its slice
+    of sources, so the summed dependencies equal the betweenness of G.
+    The workers come from joblib's reusable loky executor, so they start once per
+    interpreter and do not re-run the caller's __main__ (no guard is needed).
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    if n_jobs == 1 or n < PARALLEL_BETWEENNESS_MIN_NODES:
+        return nx.betweenness_centrality(G, normalized=normalized)
+
+    if chunk_size is None:
+        chunk_size = -(-n // n_jobs)
+    chunks = [nodes[i:i + chunk_size] for i in range(0, n, chunk_size)]
+
+    # loky does not fork the (multi-threaded) caller, and keeps its workers between calls
+    partials = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_betweenness_from_sources)(G, chunk) for chunk in chunks
+    )
+    betweenness = np.sum(partials, axis=0)
+
+    if normalized and n > 2:
+        # the subset variant halves undirected scores, full normalization does not
+        betweenness *= (1.0 if G.is_directed() else 2.0) / ((n - 1) * (n - 2))
+
+    return dict(zip(nodes, betweenness.tolist()))
+
+
+@numba.jit(nopython=True, cache=True)
+def _closeness_csr(indptr, indices, n):
+    """Wasserman-Faust closeness from one BFS per source over a CSR adjacency"""
+    # serial on purpose: the kernel is called from executor threads, which numba's
+    # parallel threading layers do not support safely
+    closeness = np.zeros(n)
+    dist = np.full(n, -1, dtype=np.int32)
+    queue = np.empty(n, dtype=np.int32)
+    for source in range(n):
+        dist[source] = 0
+        queue[0] = source
+        head = 0
+        tail = 1
+        total = 0
+        while head < tail:
+            u = queue[head]
+            head += 1
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if dist[v] < 0:
+                    dist[v] = dist[u] + 1
+                    total += dist[v]
+                    queue[tail] = v
+                    tail += 1
+        for k in range(tail):
+            dist[queue[k]] = -1
+        if total > 0:
+            closeness[source] = (tail - 1.0) / total
+            closeness[source] *= (tail - 1.0) / (n - 1)
+    return closeness
+
+
+def compute_closeness_centrality(G, adjacency=None):
+    """
+    Closeness centrality matching nx.closeness_centrality on unweighted graphs.
+    Larger graphs run a compiled BFS from every source instead of
+    NetworkX's per-node Python shortest paths. adjacency is an optional
+    (A, nodelist) pair from graph_adjacency(G).
+    """
+    n = G.number_of_nodes()
+    if n < NUMBA_CLOSENESS_MIN_NODES:
+        return nx.closeness_centrality(G)
+
+    A, nodes = adjacency if adjacency is not None else graph_adjacency(G)
+    if G.is_directed():
+        # closeness uses incoming distances on digraphs
+        A = A.T.tocsr()
+    closeness = _closeness_csr(A.indptr.astype(np.int64), A.indices.astype(np.int32), n)
+
+    return dict(zip(nodes, closeness.tolist()))
+
+
+def compute_average_clustering(G, adjacency=None):
+    """
+    Average clustering of an undirected graph from one sparse triangle count,
+    matching nx.average_clustering (self-loops ignored, unweighted).
+    adjacency is an optional (A, nodelist) pair from graph_adjacency(G).
+    """
+    n = G.number_of_nodes()
+    if G.is_directed() or n == 0:
+        return nx.average_clustering(G)
+
+    A, _ = adjacency if adjacency is not None else graph_adjacency(G)
+    A = A.astype(bool).astype(np.int64)
+    A.setdiag(0)
+    A.eliminate_zeros()
+
+    degrees = np.diff(A.indptr)
+    # each triangle through a node is counted twice along its row of (A @ A) * A
+    triangles = np.asarray((A @ A).multiply(A).sum(axis=1)).ravel()
+    denom = degrees * (degrees - 1)
+    clustering = np.divide(triangles, denom, out=np.zeros(n), where=triangles > 0)
+
+    return sum(clustering.tolist()) / n
+
+
+def louvain_partition(G):
+    """
+    Louvain communities of G computed with igraph's C implementation.
+    Returns the partition as {node: community_id} together with its modularity.
+    """
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    edge_data = G.edges(data="weight", default=1.0)
+    edges = [(index[u], index[v]) for u, v, _ in edge_data]
+    weights = [float(w) for _, _, w in edge_data]
+
+    H = ig.Graph(n=len(nodes), edges=edges, directed=False)
+    clustering = H.community_multilevel(weights=weights)
+    partition = dict(zip(nodes, clustering.membership))
+    modularity = H.modularity(clustering.membership, weights=weights) if edges else 0.0
+
+    return partition, modularity
+
 
 def calculate_betweenness_distribution(G):
-    betweenness = nx.betweenness_centrality(G)
+    betweenness = compute_betweenness_centrality(G)
     return [round(bc, 2) for bc in betweenness.values()]
 
 
@@ -32,7 +172,7 @@ def calculate_core_periphery_metrics(G, classifications):
 
 
 def calculate_community_core_overlap(G, classifications):
-    partition = community_louvain.best_partition(G)
+    partition, _ = louvain_partition(G)
     community_core_overlap = {}
 
     for node, community in partition.items():
@@ -44,16 +184,18 @@ def calculate_community_core_overlap(G, classifications):
     return community_core_overlap
 
 
-def calculate_network_metrics(graph: nx.Graph) -> Dict[str, Any]:
+def calculate_network_metrics(graph: nx.Graph, adjacency=None) -> Dict[str, Any]:
     """Calculate basic network metrics using parallel processing."""
     try:
+        if adjacency is None:
+            adjacency = graph_adjacency(graph)
         with ThreadPoolExecutor() as executor:
             futures = {
                 'nodes': executor.submit(lambda: graph.number_of_nodes()),
                 'edges': executor.submit(lambda: graph.number_of_edges()),
                 'density': executor.submit(nx.density, graph),
-                'clustering': executor.submit(nx.average_clustering, graph),
-                'degree_dist': executor.submit(lambda: [d for n, d in graph.degree()]),
+                'clustering': executor.submit(compute_average_clustering, graph, adjacency),
+                'degree_dist': executor.submit(lambda: graph_degrees(graph, adjacency)[0].tolist()),
             }
             
             try:
@@ -91,7 +233,7 @@ def calculate_network_metrics(graph: nx.Graph) -> Dict[str, Any]:
             if 'edges' in metrics:
                 metrics['edge_count'] = metrics.pop('edges')
             
-            metrics['connected_components'] = calculate_connected_components(graph)
+            metrics['connected_components'] = calculate_connected_components(graph, adjacency)
             
             return metrics
             
@@ -100,9 +242,12 @@ def calculate_network_metrics(graph: nx.Graph) -> Dict[str, Any]:
         return None
 
 
-def calculate_connected_components(G):
-    components = list(nx.connected_components(G))
-    num_components = len(components)
+def calculate_connected_components(G, adjacency=None):
+    if G.number_of_nodes() == 0:
+        num_components = 0
+    else:
+        A, _ = adjacency if adjacency is not None else graph_adjacency(G)
+        num_components, labels = connected_components(A, directed=False)
     
     if num_components == 0:
         return {
@@ -112,13 +257,13 @@ def calculate_connected_components(G):
             "component_size_distribution": []
         }
     
-    component_sizes = [len(comp) for comp in components]
+    component_sizes = np.sort(np.bincount(labels))[::-1]
     
     return {
-        "num_components": num_components,
-        "largest_component_size": max(component_sizes),
-        "smallest_component_size": min(component_sizes),
-        "component_size_distribution": sorted(component_sizes, reverse=True)
+        "num_components": int(num_components),
+        "largest_component_size": int(component_sizes[0]),
+        "smallest_component_size": int(component_sizes[-1]),
+        "component_size_distribution": component_sizes.tolist()
     }
 
 
@@ -195,15 +340,14 @@ def calculate_all_network_metrics(graph: nx.Graph, classifications: Dict, corene
         }
 
     
-def prepare_community_analysis_data(graph):
+def prepare_community_analysis_data(graph, adjacency=None):
     """
     Prepare community analysis data for visualization in the frontend.
     Returns community statistics and membership information for client-side visualization.
+    adjacency is an optional (A, nodelist) pair from graph_adjacency(graph).
     """
     try:
-        communities = community_louvain.best_partition(graph)
-        
-        modularity = community_louvain.modularity(communities, graph)
+        communities, modularity = louvain_partition(graph)
         
         community_sizes = Counter(communities.values())
         
@@ -224,7 +368,7 @@ def prepare_community_analysis_data(graph):
             "communities": {}
         }
         
-        degrees = dict(graph.degree())
+        degrees = graph_degrees(graph, adjacency)[1]
         
         for node in graph.nodes():
             node_id = str(node)
@@ -240,12 +384,10 @@ def prepare_community_analysis_data(graph):
             })
             graph_data["communities"][node_id] = community_id
         
-        for source, target in graph.edges():
-            graph_data["edges"].append({
-                "source": str(source),
-                "target": str(target),
-                "weight": 1
-            })
+        graph_data["edges"] = [
+            {"source": str(source), "target": str(target), "weight": 1}
+            for source, target in graph.edges()
+        ]
         
         return {
             "num_communities": num_communities,
@@ -6,7 +6,7 @@ from typing import Tuple, Dict, Any
 import uuid
 from fastapi import UploadFile
 import os
-import shutil
+import asyncio
 import pandas as pd
 from .BE import BE
 from .optimized_be import OptimizedBE
@@ -22,6 +22,8 @@ import io
 import base64
 from scipy.stats import norm
 
+UPLOAD_CHUNK_SIZE = 1 << 20
+
 output_dir = "../static"
 if not os.path.exists(output_dir):
     os.makedirs(output_dir)
@@ -126,7 +128,7 @@ def load_graph_from_path(path: str, filename: str = None) -> nx.Graph:
 
             try:
                 print("Attempting to read CSV/text file with header=0.")
-                df_read_with_header = pd.read_csv(path, sep=sep, encoding='utf-8', engine='python')
+                df_read_with_header = pd.read_csv(path, sep=sep, encoding='utf-8', engine='c')
 
                 header_is_likely_data = all(isinstance(col, (int, float)) or (isinstance(col, str) and col.replace('.', '', 1).isdigit()) for col in df_read_with_header.columns)
 
@@ -149,7 +151,7 @@ def load_graph_from_path(path: str, filename: str = None) -> nx.Graph:
             if df is None:
                 try:
                     print("Attempting to read CSV/text file with header=None.")
-                    df_no_header = pd.read_csv(path, sep=sep, header=None, encoding='utf-8', engine='python')
+                    df_no_header = pd.read_csv(path, sep=sep, header=None, encoding='utf-8', engine='c')
                     df = infer_edge_list_columns(df_no_header)
                     print("Successfully read with header=None and inferred columns.")
 
@@ -221,16 +223,15 @@ def load_graph_from_path(path: str, filename: str = None) -> nx.Graph:
             raise ValueError(f"Unsupported file type: {ext}")
 
         print(f"Successfully loaded graph from {path}. Nodes: {G.number_of_nodes()}, Edges: {G.number_of_edges()}")
+        # Count weighted edges in one pass instead of materializing the full attribute dict
+        weighted_edges = sum(1 for _, _, w in G.edges(data='weight') if w is not None)
         if 'weight' in edge_attrs:
-            weights = nx.get_edge_attributes(G, 'weight')
-            if weights:
-                print(f"Loaded {len(weights)} edges with 'weight' attribute from CSV/text file.")
+            if weighted_edges:
+                print(f"Loaded {weighted_edges} edges with 'weight' attribute from CSV/text file.")
             else:
                 print("Warning: 'weight' column was present in CSV/text file but no numeric weights were loaded onto edges.")
-        elif G is not None:
-             edge_weights = nx.get_edge_attributes(G, 'weight')
-             if edge_weights:
-                 print(f"Detected {len(edge_weights)} edges with 'weight' attribute in the loaded graph ({ext} format).")
+        elif weighted_edges:
+             print(f"Detected {weighted_edges} edges with 'weight' attribute in the loaded graph ({ext} format).")
 
         return G
 
@@ -256,10 +257,13 @@ async def load_graph_file(file: UploadFile) -> nx.Graph:
     temp_path = os.path.join(temp_dir, f"{uuid.uuid4()}.{ext}")
 
     try:
+        # Stream the upload in chunks and keep disk writes and parsing off the event loop
+        loop = asyncio.get_running_loop()
         with open(temp_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await loop.run_in_executor(None, f.write, chunk)
 
-        G = load_graph_from_path(temp_path, filename)
+        G = await loop.run_in_executor(None, load_graph_from_path, temp_path, filename)
         return G
 
     except Exception as e:
@@ -276,10 +280,14 @@ async def load_graph_file(file: UploadFile) -> nx.Graph:
 
 def classify_nodes_by_coreness(graph: nx.Graph, coreness: Dict, threshold: float = 0.5) -> Dict:
 
-    classifications = {node: 'C' if coreness.get(node, 0) >= threshold else 'P' for node in graph.nodes()}
+    nodes = list(graph.nodes())
+    values = np.fromiter((coreness.get(node, 0) for node in nodes), dtype=np.float64, count=len(nodes))
+    is_core = values >= threshold
+
+    classifications = dict(zip(nodes, np.where(is_core, 'C', 'P').tolist()))
 
-    core_count = sum(1 for v in classifications.values() if v == 'C')
-    periphery_count = sum(1 for v in classifications.values() if v == 'P')
+    core_count = int(is_core.sum())
+    periphery_count = len(nodes) - core_count
     print(f"Classification result: {core_count} core nodes, {periphery_count} periphery nodes")
     
     return classifications
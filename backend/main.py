@@ -1,23 +1,27 @@
 import os
 import networkx as nx
+import numpy as np
+from scipy import sparse
 import asyncio
 import time
 import glob
 import json
+import functools
 from collections import Counter
             
 import concurrent.futures
+import orjson
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Body
 from fastapi.responses import JSONResponse
 import uvicorn
-import community as community_louvain
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import FileResponse
 from pydantic import BaseModel
 
 from .functions import load_graph_file, get_algorithm_function, get_node_classifications_and_coreness, generate_csv, generate_edges_csv, generate_gdf, get_core_stats
-from .Metrics import calculate_all_network_metrics, calculate_network_metrics, calculate_connected_components, prepare_community_analysis_data
+from .utils import graph_adjacency, graph_degrees, top_k_indices
+from .Metrics import calculate_all_network_metrics, calculate_network_metrics, calculate_connected_components, prepare_community_analysis_data, compute_betweenness_centrality, compute_closeness_centrality, louvain_partition
 
 from contextlib import asynccontextmanager
 
@@ -34,7 +38,17 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
-app = FastAPI(lifespan=lifespan)
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson, which also serializes numpy values and non-str keys.
+
+    FastAPI's own ORJSONResponse is deprecated since 0.131, so the rendering is done here.
+    orjson writes NaN/inf metrics as null, where the stdlib JSONResponse refused them with a 500.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 output_dir = os.path.abspath(os.path.join(current_dir, "..", "static"))
@@ -69,19 +83,24 @@ async def upload_graph(
             raise HTTPException(status_code=400, detail="Invalid format for selectedAnalyses")
 
         try:
-            global_graph = await load_graph_file(file)
-            print(f"Graph loaded successfully: {global_graph.number_of_nodes()} nodes, {global_graph.number_of_edges()} edges")
+            graph = await load_graph_file(file)
+            global_graph = graph
+            print(f"Graph loaded successfully: {graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges")
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Error loading file: {str(e)}")
 
         network_metrics = {}
         community_data = None
         degree_distribution = None
+        loop = asyncio.get_running_loop()
         
         try:
+            # CSR adjacency and node order shared by every metric of this request
+            adjacency = await loop.run_in_executor(None, graph_adjacency, graph)
+
             if analyses_to_run.get("networkStats", False) or analyses_to_run.get("degreeDistribution", False) or analyses_to_run.get("connectedComponents", False):
                 print("Calculating basic network metrics...")
-                calculated_metrics = calculate_network_metrics(global_graph)
+                calculated_metrics = await loop.run_in_executor(None, calculate_network_metrics, graph, adjacency)
                 
                 if analyses_to_run.get("networkStats", False):
                     network_metrics.update({
@@ -99,29 +118,23 @@ async def upload_graph(
 
             if analyses_to_run.get("communityAnalysis", False):
                 print("Calculating community data...")
-                community_data = prepare_community_analysis_data(global_graph)
+                community_data = await loop.run_in_executor(None, prepare_community_analysis_data, graph, adjacency)
 
             graph_data = {
-                "nodes": [],
-                "edges": []
+                "nodes": [
+                    {"id": str(node), "degree": node_degree}
+                    for node, node_degree in graph_degrees(graph, adjacency)[1].items()
+                ],
+                "edges": [
+                    {
+                        "id": f"{source}-{target}",
+                        "source": str(source),
+                        "target": str(target),
+                        "weight": float(weight)
+                    }
+                    for source, target, weight in graph.edges(data="weight", default=1.0)
+                ]
             }
-            degrees = dict(global_graph.degree())
-            for node in global_graph.nodes():
-                node_degree = degrees.get(node, 0)
-                graph_data["nodes"].append({
-                    "id": str(node),
-                    "degree": node_degree,
-                })
-            for edge in global_graph.edges():
-                source, target = edge
-                edge_data = global_graph.get_edge_data(source, target) or {}
-                weight = edge_data.get('weight', 1.0)
-                graph_data["edges"].append({
-                    "id": f"{source}-{target}",
-                    "source": str(source),
-                    "target": str(target),
-                    "weight": float(weight)
-                })
             
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Error during analysis: {str(e)}")
@@ -137,7 +150,7 @@ async def upload_graph(
         #if degree_distribution is not None:
         #    response_content["degree_distribution"] = degree_distribution
 
-        return JSONResponse(content=response_content)
+        return ORJSONResponse(content=response_content)
         
     except HTTPException as he:
         raise he
@@ -181,10 +194,16 @@ async def analyze_uploaded_graph(
         else:
             raise HTTPException(status_code=400, detail=f"Invalid algorithm: {algorithm}")
         
+        # Heavy analysis runs on worker threads so the event loop keeps serving other requests
+        loop = asyncio.get_running_loop()
         algorithm_func = get_algorithm_function(algorithm)
-        classifications, coreness, algorithm_stats = algorithm_func(graph, **params)
+        classifications, coreness, algorithm_stats = await loop.run_in_executor(
+            None, functools.partial(algorithm_func, graph, **params)
+        )
         
-        degrees = dict(graph.degree())
+        # CSR adjacency and node order shared by the degree and centrality passes below
+        adjacency = await loop.run_in_executor(None, graph_adjacency, graph)
+        degrees = graph_degrees(graph, adjacency)[1]
         
         closeness = {}
         betweenness = {}
@@ -319,7 +338,7 @@ async def analyze_uploaded_graph(
             def compute_closeness():
                 try:
                     print("Computing closeness centrality...")
-                    close_cent = nx.closeness_centrality(graph)
+                    close_cent = compute_closeness_centrality(graph, adjacency)
                     centrality_values = list(close_cent.values())
                     if centrality_values:
                         centrality_summary["closeness"] = {
@@ -338,7 +357,7 @@ async def analyze_uploaded_graph(
             def compute_betweenness():
                 try:
                     print("Computing betweenness centrality...")
-                    between_cent = nx.betweenness_centrality(graph)
+                    between_cent = compute_betweenness_centrality(graph)
                     centrality_values = list(between_cent.values())
                     if centrality_values:
                         centrality_summary["betweenness"] = {
@@ -355,18 +374,16 @@ async def analyze_uploaded_graph(
                     return {node: 0.0 for node in graph.nodes()}
             
             if calculate_closeness and calculate_betweenness:
-                with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-                    future_closeness = executor.submit(compute_closeness)
-                    future_betweenness = executor.submit(compute_betweenness)
-                    
-                    closeness = future_closeness.result()
-                    betweenness = future_betweenness.result()
+                closeness, betweenness = await asyncio.gather(
+                    loop.run_in_executor(None, compute_closeness),
+                    loop.run_in_executor(None, compute_betweenness)
+                )
                     
                 print("Completed both centrality calculations in parallel")
             elif calculate_closeness:
-                closeness = compute_closeness()
+                closeness = await loop.run_in_executor(None, compute_closeness)
             elif calculate_betweenness:
-                betweenness = compute_betweenness()
+                betweenness = await loop.run_in_executor(None, compute_betweenness)
 
         node_csv_file = generate_csv(
             graph, 
@@ -396,14 +413,15 @@ async def analyze_uploaded_graph(
             pre_calculated_edge_types=edge_types
         )
 
-        network_metrics = calculate_all_network_metrics(
+        network_metrics = await loop.run_in_executor(None, functools.partial(
+            calculate_all_network_metrics,
             graph, 
             classifications, 
             coreness, 
             algorithm, 
             {**params, "final_score": algorithm_stats.get("final_score")}, 
             pre_calculated_core_stats=core_stats
-        )
+        ))
 
         graph_data = {"nodes": [], "edges": []}
         
@@ -423,23 +441,27 @@ async def analyze_uploaded_graph(
             
             graph_data["nodes"].append(node_data)
 
-        for edge in graph.edges():
-            source, target = edge
-            edge_data = graph.get_edge_data(source, target) or {}
-            weight = edge_data.get('weight', 1.0)
-            
-            graph_data["edges"].append({
+        graph_data["edges"] = [
+            {
                 "id": f"{source}-{target}",
                 "source": str(source),
                 "target": str(target),
                 "weight": float(weight)
-            })
+            }
+            for source, target, weight in graph.edges(data="weight", default=1.0)
+        ]
         
         core_nodes_data = [node for node in graph_data["nodes"] if node["type"] == "C"]
         periphery_nodes_data = [node for node in graph_data["nodes"] if node["type"] == "P"]
 
-        top_core_nodes = sorted(core_nodes_data, key=lambda node: node["coreness"], reverse=True)[:5]
-        top_periphery_nodes = sorted(periphery_nodes_data, key=lambda node: node["coreness"])[:5]
+        top_core_nodes = [
+            core_nodes_data[i]
+            for i in top_k_indices([node["coreness"] for node in core_nodes_data], 5)
+        ]
+        top_periphery_nodes = [
+            periphery_nodes_data[i]
+            for i in top_k_indices([node["coreness"] for node in periphery_nodes_data], 5, largest=False)
+        ]
 
         top_nodes_result = {
             "top_core_nodes": top_core_nodes,
@@ -449,7 +471,7 @@ async def analyze_uploaded_graph(
         if calculate_closeness or calculate_betweenness:
             top_nodes_result["centrality_summary"] = centrality_summary
 
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "message": f"Core-periphery analysis with {algorithm} algorithm completed successfully",
             "network_metrics": network_metrics,
             "top_nodes": top_nodes_result,
@@ -503,28 +525,29 @@ async def check_file(filename: str):
 
 #Not used for now idk let it here for now
 # modularity_core_periphery_detection modularita podla Rombach et al. (2017)
-def modularity_core_periphery_detection(G: nx.Graph):
+def modularity_core_periphery_detection(G: nx.Graph, adjacency=None):
 
     if G.number_of_nodes() == 0:
         return [], []
 
-    partition = community_louvain.best_partition(G)
+    partition, _ = louvain_partition(G)
+
+    A, nodelist = adjacency if adjacency is not None else graph_adjacency(G)
+    A = sparse.triu(A, format="coo")
+    labels = np.fromiter((partition[n] for n in nodelist), dtype=np.int64, count=len(nodelist))
+    num_communities = labels.max() + 1
 
-    community_groups = {}
-    for node, comm_id in partition.items():
-        community_groups.setdefault(comm_id, []).append(node)
+    internal = labels[A.row] == labels[A.col]
+    internal_edges = np.bincount(labels[A.row[internal]], minlength=num_communities)
+    sizes = np.bincount(labels, minlength=num_communities)
+    max_edges = sizes * (sizes - 1) / 2
+    density = np.divide(internal_edges, max_edges, out=np.zeros(num_communities), where=max_edges > 0)
 
-    max_density = -1
-    core_comm = None
-    for comm_id, nodes in community_groups.items():
-        subgraph = G.subgraph(nodes)
-        d = nx.density(subgraph)
-        if d > max_density:
-            max_density = d
-            core_comm = comm_id
+    core_comm = max(dict.fromkeys(partition.values()), key=lambda comm_id: density[comm_id])
 
-    core_nodes = community_groups[core_comm]
-    periphery_nodes = [n for n in G.nodes() if n not in core_nodes]
+    core_nodes = [n for n, comm_id in partition.items() if comm_id == core_comm]
+    core_set = set(core_nodes)
+    periphery_nodes = [n for n in nodelist if n not in core_set]
 
     return core_nodes, periphery_nodes
 
@@ -1,17 +1,19 @@
 from collections import Counter, defaultdict
 
-import matplotlib as mpl
 import networkx as nx
-import numba
 import numpy as np
-import pandas as pd
-import plotly.graph_objects as go
-import seaborn as sns
+from joblib import Parallel, delayed
 from scipy import sparse
 from typing import Dict, Optional
-import matplotlib.pyplot as plt
-from matplotlib.patches import Patch
 import os
+import weakref
+
+# Same bins as BoundaryNorm(np.linspace(0, 1, 11), ncolors=12, extend="both"):
+# digitize index -> color index, with -1/12 for values under/over the bounds.
+_NORM_BOUNDS = np.linspace(0, 1, 11)
+_NORM_LUT = np.array([-1, *range(1, 11), 12])
+
+_layout_cache = weakref.WeakKeyDictionary()
 
 def to_adjacency_matrix(net):
     if sparse.issparse(net):
@@ -19,14 +21,51 @@ def to_adjacency_matrix(net):
             return net
         return sparse.csr_matrix(net, dtype=np.float64), np.arange(net.shape[0])
     elif "networkx" in "%s" % type(net):
-        return (
-            sparse.csr_matrix(nx.adjacency_matrix(net), dtype=np.float64),
-            net.nodes(),
-        )
+        nodes = np.fromiter(net.nodes(), dtype=object, count=net.number_of_nodes())
+        A = nx.to_scipy_sparse_array(net, nodelist=nodes, format="csr", dtype=np.float64)
+        return sparse.csr_matrix(A, copy=False), nodes
     elif "numpy.ndarray" == type(net):
         return sparse.csr_matrix(net, dtype=np.float64), np.arange(net.shape[0])
 
 
+def graph_adjacency(G):
+    """Return the unweighted CSR adjacency of G and its node order.
+
+    Build it once per request and pass the (A, nodelist) pair to the helpers that
+    accept an ``adjacency`` argument, so the graph is converted only once.
+    """
+    nodelist = list(G.nodes())
+    if not nodelist:
+        # to_scipy_sparse_array rejects a graph without nodes
+        return sparse.csr_array((0, 0), dtype=np.int64), nodelist
+    return nx.to_scipy_sparse_array(G, nodelist=nodelist, weight=None, format="csr"), nodelist
+
+
+def graph_degrees(G, adjacency=None):
+    """Return the degrees of G as an array in adjacency node order and as a {node: degree} dict."""
+    A, nodelist = adjacency if adjacency is not None else graph_adjacency(G)
+    if G.is_directed():
+        degs = np.asarray(A.sum(axis=1)).ravel() + np.asarray(A.sum(axis=0)).ravel()
+    else:
+        # self-loops add two to the degree but sit on the diagonal once
+        degs = np.asarray(A.sum(axis=1)).ravel() + A.diagonal()
+    degs = degs.astype(np.int64)
+    return degs, dict(zip(nodelist, degs.tolist()))
+
+
+def top_k_indices(values, k, largest=True):
+    """Indices of the k largest (or smallest) values, ordered as a stable sort would, via argpartition."""
+    values = np.asarray(values, dtype=np.float64)
+    if not largest:
+        values = -values
+    if len(values) <= k:
+        candidates = np.arange(len(values))
+    else:
+        kth_value = values[np.argpartition(values, -k)[-k:]].min()
+        candidates = np.flatnonzero(values >= kth_value)
+    return candidates[np.argsort(-values[candidates], kind="stable")][:k]
+
+
 def to_nxgraph(net):
     if sparse.issparse(net):
         return nx.from_scipy_sparse_matrix(net)
@@ -36,12 +75,20 @@ def to_nxgraph(net):
         return nx.from_numpy_array(net)
 
 
+def _rgb_to_hex(rgb):
+    rgb = np.rint(rgb * 255).astype(int)
+    return [["#%02x%02x%02x" % tuple(v) for v in palette] for palette in rgb]
+
+
 def set_node_colors(c, x, cmap, colored_nodes):
+    import seaborn as sns
+    from matplotlib.colors import to_rgb
 
     node_colors = defaultdict(lambda x: "#8d8d8d")
     node_edge_colors = defaultdict(lambda x: "#4d4d4d")
 
-    cnt = Counter([c[d] for d in colored_nodes])
+    c_vals = [c[d] for d in colored_nodes]
+    cnt = Counter(c_vals)
     num_groups = len(cnt)
 
     if cmap is None:
@@ -58,46 +105,85 @@ def set_node_colors(c, x, cmap, colored_nodes):
             [cmap[i] for i in range(num_groups)],
         )
     )
-    bounds = np.linspace(0, 1, 11)
-    norm = mpl.colors.BoundaryNorm(bounds, ncolors=12, extend="both")
-
-    cmap_coreness = {
-        k: sns.light_palette(v, n_colors=12).as_hex() for k, v in cmap.items()
-    }
-    cmap_coreness_dark = {
-        k: sns.dark_palette(v, n_colors=12).as_hex() for k, v in cmap.items()
-    }
-
-    for d in colored_nodes:
-        node_colors[d] = cmap_coreness[c[d]][norm(x[d]) - 1]
-        node_edge_colors[d] = cmap_coreness_dark[c[d]][-norm(x[d])]
+
+    base_rgb = np.array([to_rgb(v) for v in cmap.values()], dtype=np.float64).reshape(-1, 1, 3)
+    t = np.linspace(0, 1, 12).reshape(1, -1, 1)
+    light_rgb = (1 - t) + t * base_rgb
+    dark_rgb = t * base_rgb
+
+    cmap_coreness = dict(zip(cmap.keys(), _rgb_to_hex(light_rgb)))
+    cmap_coreness_dark = dict(zip(cmap.keys(), _rgb_to_hex(dark_rgb)))
+
+    bins = _NORM_LUT[np.digitize([x[d] for d in colored_nodes], _NORM_BOUNDS)]
+    for d, cv, b in zip(colored_nodes, c_vals, bins.tolist()):
+        node_colors[d] = cmap_coreness[cv][b - 1]
+        node_edge_colors[d] = cmap_coreness_dark[cv][-b]
     return node_colors, node_edge_colors
 
 
-def classify_nodes(G, c, x, max_num=None):
-    non_residuals = [d for d in G.nodes() if (c[d] is not None) and (x[d] is not None)]
-    residuals = [d for d in G.nodes() if (c[d] is None) or (x[d] is None)]
+def _node_arrays(G, c, x):
+    """Return the node labels of G and the values of c and x as arrays in node order."""
+    num_nodes = G.number_of_nodes()
+    nodelist = np.fromiter(G.nodes(), dtype=object, count=num_nodes)
+    c_arr = np.fromiter((c[d] for d in nodelist), dtype=object, count=num_nodes)
+    x_arr = np.fromiter((x[d] for d in nodelist), dtype=object, count=num_nodes)
+    return nodelist, c_arr, x_arr
+
 
-    cnt = Counter([c[d] for d in non_residuals])
-    cvals = np.array([d[0] for d in cnt.most_common(len(cnt))])
+def _classify_node_indices(c_arr, x_arr, max_num=None):
+    is_residual = np.fromiter(
+        (cv is None or xv is None for cv, xv in zip(c_arr, x_arr)),
+        dtype=bool,
+        count=len(c_arr),
+    )
+    non_residuals = np.flatnonzero(~is_residual)
+    residuals = np.flatnonzero(is_residual)
+
+    cnt = Counter(c_arr[non_residuals].tolist())
+    cvals = [d[0] for d in cnt.most_common(len(cnt))]
 
     if max_num is not None:
         cvals = set(cvals[:max_num])
     else:
         cvals = set(cvals)
 
-    colored_nodes = [d for d in non_residuals if c[d] in cvals]
-    muted = [d for d in non_residuals if not c[d] in cvals]
+    is_colored = np.fromiter(
+        (cv in cvals for cv in c_arr[non_residuals]),
+        dtype=bool,
+        count=len(non_residuals),
+    )
+    colored_nodes = non_residuals[is_colored]
+    muted = non_residuals[~is_colored]
 
-    order = np.argsort([x[d] for d in colored_nodes])
-    colored_nodes = [colored_nodes[d] for d in order]
+    order = np.argsort(x_arr[colored_nodes].astype(np.float64))
+    colored_nodes = colored_nodes[order]
 
     return colored_nodes, muted, residuals
 
 
+def classify_nodes(G, c, x, max_num=None):
+    nodelist, c_arr, x_arr = _node_arrays(G, c, x)
+    colored_nodes, muted, residuals = _classify_node_indices(c_arr, x_arr, max_num)
+    return (
+        nodelist[colored_nodes].tolist(),
+        nodelist[muted].tolist(),
+        nodelist[residuals].tolist(),
+    )
+
+
+def spring_layout(G, seed=42):
+    """Spring layout of G, computed once per graph and seed and reused until G changes size."""
+    key = (seed, G.number_of_nodes(), G.number_of_edges())
+    cached = _layout_cache.get(G)
+    if cached is None or cached[0] != key:
+        cached = (key, nx.spring_layout(G, seed=seed))
+        _layout_cache[G] = cached
+    return cached[1]
+
+
 def calc_node_pos(G, layout_algorithm):
     if layout_algorithm is None:
-        return nx.spring_layout(G)
+        return spring_layout(G)
     else:
         return layout_algorithm(G)
 
@@ -115,6 +201,7 @@ def draw(
     draw_edges_kwd={"edge_color": "#adadad"},
     draw_labels_kwd={},
     layout_algorithm=None,
+    classification=None,
 ):
     """Plot the core-periphery structure in the networks.
 
@@ -144,6 +231,8 @@ def draw(
     :type draw_labels_kwd: dict, optional
     :param layout_kwd: layout keywords, defaults to {}
     :type layout_kwd: dict, optional
+    :param classification: (colored_nodes, muted_nodes, residuals) as returned by classify_nodes, computed if None, defaults to None
+    :type classification: tuple, optional
     :return: (ax, pos)
     :rtype: matplotlib.pyplot.ax, dict
     """
@@ -154,9 +243,20 @@ def draw(
     c = {node: c.get(node, default_c) for node in G.nodes()}
     x = {node: x.get(node, default_x) for node in G.nodes()}"""
 
-    colored_nodes, muted_nodes, residuals = classify_nodes(G, c, x, max_group_num)
-
-    node_colors, node_edge_colors = set_node_colors(c, x, cmap, colored_nodes)
+    if classification is None:
+        nodelist, c_arr, x_arr = _node_arrays(G, c, x)
+        colored_keys, _, residual_idx = _classify_node_indices(
+            c_arr, x_arr, max_group_num
+        )
+        node_colors, node_edge_colors = set_node_colors(
+            c_arr, x_arr, cmap, colored_keys
+        )
+        colored_nodes = nodelist[colored_keys].tolist()
+        residuals = nodelist[residual_idx].tolist()
+    else:
+        colored_nodes, _, residuals = classification
+        colored_keys = colored_nodes
+        node_colors, node_edge_colors = set_node_colors(c, x, cmap, colored_nodes)
 
     if pos is None:
         pos = calc_node_pos(G, layout_algorithm)
@@ -164,7 +264,7 @@ def draw(
     nodes = nx.draw_networkx_nodes(
         G,
         pos,
-        node_color=[node_colors[d] for d in colored_nodes],
+        node_color=[node_colors[k] for k in colored_keys],
         nodelist=colored_nodes,
         ax=ax,
         # zorder=3,
@@ -172,7 +272,7 @@ def draw(
     )
     if nodes is not None:
         nodes.set_zorder(3)
-        nodes.set_edgecolor([node_edge_colors[r] for r in colored_nodes])
+        nodes.set_edgecolor([node_edge_colors[k] for k in colored_keys])
 
     draw_nodes_kwd_residual = draw_nodes_kwd.copy()
     draw_nodes_kwd_residual["node_size"] = 0.1 * draw_nodes_kwd.get("node_size", 100)
@@ -207,34 +307,27 @@ def draw(
 def draw_interactive(G, c, x, hover_text=None, node_size=10.0, pos=None, cmap=None):
     try:        
         if pos is None:
-            pos = nx.spring_layout(G)
+            pos = spring_layout(G)
+
+        nodelist, c_arr, x_arr = _node_arrays(G, c, x)
+        P = np.array([pos[node] for node in nodelist], dtype=np.float64).reshape(-1, 2)
 
         node_trace = {
-            'x': [],
-            'y': [],
-            'text': [],
+            'x': P[:, 0].tolist(),
+            'y': P[:, 1].tolist(),
+            'text': [
+                f'Node: {node}<br>Core: {c_val}<br>Coreness: {x_val}'
+                for node, c_val, x_val in zip(nodelist, c_arr, x_arr)
+            ],
             'mode': 'markers',
             'hoverinfo': 'text',
             'marker': {
-                'size': [],
-                'color': [],
+                'size': ((x_arr.astype(np.float64) + 1) * node_size).tolist(),
+                'color': np.where(c_arr == 1, 'red', 'blue').tolist(),
                 'line': {'color': [], 'width': 1}
             }
         }
 
-        for node in G.nodes():
-            x_pos, y_pos = pos[node]
-            node_trace['x'].append(x_pos)
-            node_trace['y'].append(y_pos)
-            
-            size = (x[node] + 1) * node_size
-            node_trace['marker']['size'].append(size)
-            
-            color = 'red' if c[node] == 1 else 'blue'
-            node_trace['marker']['color'].append(color)
-            
-            node_trace['text'].append(f'Node: {node}<br>Core: {c[node]}<br>Coreness: {x[node]}')
-
         figure = {
             'data': [node_trace],
             'layout': {
@@ -274,36 +367,82 @@ def draw_interactive(G, c, x, hover_text=None, node_size=10.0, pos=None, cmap=No
             }
         }
 
-def save_visualization(graph, classifications, output_path, title=None):
+RASTER_EDGES_MIN_NODES = 500
+
+
+def _rasterize_segments(segments, width, height, max_samples=1 << 20):
+    """Accumulate line segments into a height x width count canvas, sampling each segment once per pixel.
+    Segments are taken in chunks of about max_samples pixel samples, which bounds the temporary arrays."""
+    lo = segments.reshape(-1, 2).min(axis=0)
+    span = segments.reshape(-1, 2).max(axis=0) - lo
+    span[span == 0] = 1.0
+    scale = np.array([width - 1, height - 1]) / span
+    seg = ((segments - lo) * scale).astype(np.float32)
+    p0, d = seg[:, 0], seg[:, 1] - seg[:, 0]
+    steps = np.ceil(np.abs(d).max(axis=1)).astype(np.int32) + 1
+    canvas = np.zeros(width * height, dtype=np.float64)
+
+    # split on the cumulative sample count, since one segment can need up to width samples
+    cum_steps = np.cumsum(steps, dtype=np.int64)
+    bounds = np.searchsorted(cum_steps, np.arange(max_samples, cum_steps[-1], max_samples), side="right")
+    for start, stop in zip([0, *bounds], [*bounds, len(seg)]):
+        if start == stop:
+            continue
+        chunk_steps = steps[start:stop]
+        edge_idx = np.repeat(np.arange(start, stop, dtype=np.int32), chunk_steps)
+        offsets = np.repeat(np.cumsum(chunk_steps) - chunk_steps, chunk_steps)
+        t = (np.arange(len(edge_idx), dtype=np.int32) - offsets).astype(np.float32)
+        t /= np.maximum(steps - 1, 1).astype(np.float32)[edge_idx]
+        xy = np.rint(p0[edge_idx] + t[:, None] * d[edge_idx]).astype(np.int32)
+        canvas += np.bincount((height - 1 - xy[:, 1]) * width + xy[:, 0], minlength=width * height)
+
+    return canvas.reshape(height, width), (lo[0], lo[0] + span[0], lo[1], lo[1] + span[1])
+
+
+def save_visualization(graph, classifications, output_path, title=None, pos=None):
     """Save a visualization of the graph with core-periphery structure."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection
+
     try:
-        plt.figure(figsize=(10, 8))
-        
-        pos = nx.spring_layout(graph, seed=42)
+        fig = Figure(figsize=(10, 8), dpi=300, layout="tight")
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
         
-        core_nodes = [node for node, cls in classifications.items() if cls == "C"]
-        periphery_nodes = [node for node, cls in classifications.items() if cls == "P"]
+        if pos is None:
+            pos = spring_layout(graph)
         
-        nx.draw_networkx_nodes(graph, pos, 
-                              nodelist=core_nodes,
-                              node_color='red',
-                              node_size=100,
-                              alpha=0.8)
+        nodelist = list(graph.nodes())
+        P = np.array([pos[n] for n in nodelist], dtype=np.float64).reshape(-1, 2)
+        node_classes = np.array([classifications.get(n) for n in nodelist], dtype=object)
+        is_core = node_classes == "C"
+        is_periphery = node_classes == "P"
         
-        nx.draw_networkx_nodes(graph, pos, 
-                              nodelist=periphery_nodes,
-                              node_color='blue',
-                              node_size=60,
-                              alpha=0.6)
+        if nodelist:
+            A = sparse.triu(nx.to_scipy_sparse_array(graph, nodelist=nodelist, format="coo"), format="coo")
+            edge_segments = np.stack([P[A.row], P[A.col]], axis=1)
+        else:
+            # to_scipy_sparse_array rejects an empty graph; draw an empty figure instead
+            edge_segments = np.empty((0, 2, 2))
+        if len(nodelist) >= RASTER_EDGES_MIN_NODES and len(edge_segments):
+            # Large graphs: draw the edge layer as one image instead of one path per edge
+            edge_counts, extent = _rasterize_segments(edge_segments, 1500, 1000)
+            ax.imshow(np.log1p(edge_counts), cmap="Greys", extent=extent, aspect="auto",
+                      interpolation="nearest", alpha=0.6)
+        else:
+            ax.add_collection(LineCollection(edge_segments, colors="k", alpha=0.3))
         
-        nx.draw_networkx_edges(graph, pos, alpha=0.3)
+        ax.scatter(P[is_core, 0], P[is_core, 1], c='red', s=100, alpha=0.8)
+        ax.scatter(P[is_periphery, 0], P[is_periphery, 1], c='blue', s=60, alpha=0.6)
+        ax.autoscale_view()
         
         if title:
-            plt.title(title)
-        plt.axis('off')
+            ax.set_title(title)
+        ax.axis('off')
         
         print(f"Debug - Saving visualization to: {output_path}")
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        canvas.print_png(output_path)
         print(f"Debug - Successfully saved visualization to: {output_path}")
         
         if os.path.exists(output_path):
@@ -311,10 +450,22 @@ def save_visualization(graph, classifications, output_path, title=None):
         else:
             print(f"Debug - WARNING: File was not created at: {output_path}")
             
-        plt.close()
         print("Debug - Successfully created figure")
         
         return True
     except Exception as e:
         print(f"Error saving visualization: {str(e)}")
-        return False
\ No newline at end of file
+        return False
+
+
+def save_visualizations_batch(graph_list, classifications_list, paths, title_list=None, n_jobs=-1):
+    """Save visualizations of several graphs in parallel worker processes."""
+    if title_list is None:
+        title_list = [None] * len(graph_list)
+
+    return Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(save_visualization)(graph, classifications, output_path, title)
+        for graph, classifications, output_path, title in zip(
+            graph_list, classifications_list, paths, title_list
+        )
+    )
@@ -0,0 +1,106 @@
+import networkx as nx
+import pytest
+
+from backend import Metrics
+from backend.Metrics import (
+    calculate_connected_components,
+    compute_average_clustering,
+    compute_betweenness_centrality,
+    compute_closeness_centrality,
+)
+from backend.utils import RASTER_EDGES_MIN_NODES, graph_adjacency, graph_degrees, save_visualization, top_k_indices
+
+
+def assert_close(result, expected):
+    assert result.keys() == expected.keys()
+    for node, value in expected.items():
+        assert result[node] == pytest.approx(value, abs=1e-12)
+
+
+@pytest.mark.parametrize("graph", [
+    nx.gnp_random_graph(RASTER_EDGES_MIN_NODES + 100, 0.01, seed=1),
+    nx.karate_club_graph(),
+    nx.Graph(),
+], ids=["rasterized-edges", "line-collection", "empty"])
+def test_save_visualization(graph, tmp_path):
+    classes = {node: "C" if i % 10 == 0 else "P" for i, node in enumerate(graph)}
+    output_path = tmp_path / "graph.png"
+
+    assert save_visualization(graph, classes, str(output_path))
+    assert output_path.stat().st_size > 0
+
+
+@pytest.mark.parametrize("graph", [
+    nx.Graph([(0, 0), (0, 1), (1, 2), ("a", "b")]),
+    nx.DiGraph([(0, 1), (1, 0), (1, 2), (2, 2)]),
+    nx.MultiGraph([(0, 1), (0, 1), (1, 1)]),
+    nx.Graph(),
+], ids=["self-loop", "directed", "multigraph", "empty"])
+def test_graph_degrees_match_networkx(graph):
+    degs, deg_dict = graph_degrees(graph)
+
+    assert deg_dict == dict(graph.degree())
+    assert degs.tolist() == [graph.degree(node) for node in graph_adjacency(graph)[1]]
+
+
+def test_graph_degrees_follow_edits_to_a_copy():
+    G = nx.path_graph(6)
+    graph_degrees(G)
+    H = G.copy()
+    H.remove_edge(2, 3)
+    H.add_edge(0, 5)
+
+    assert graph_degrees(H)[1] == dict(H.degree())
+    assert graph_degrees(G)[1] == dict(G.degree())
+
+
+def test_top_k_indices_keep_stable_tie_order():
+    values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+
+    for k in (1, 3, 5, len(values), len(values) + 2):
+        largest = sorted(range(len(values)), key=lambda i: values[i], reverse=True)[:k]
+        smallest = sorted(range(len(values)), key=lambda i: values[i])[:k]
+        assert top_k_indices(values, k).tolist() == largest
+        assert top_k_indices(values, k, largest=False).tolist() == smallest
+
+
+@pytest.mark.parametrize("graph", [
+    nx.gnp_random_graph(Metrics.NUMBA_CLOSENESS_MIN_NODES + 100, 0.005, seed=2),
+    nx.gnp_random_graph(Metrics.NUMBA_CLOSENESS_MIN_NODES + 100, 0.005, seed=3, directed=True),
+    nx.karate_club_graph(),
+], ids=["compiled", "compiled-directed", "networkx"])
+def test_closeness_matches_networkx(graph):
+    expected = nx.closeness_centrality(graph)
+
+    assert_close(compute_closeness_centrality(graph), expected)
+    assert_close(compute_closeness_centrality(graph, graph_adjacency(graph)), expected)
+
+
+@pytest.mark.parametrize("graph", [
+    nx.gnp_random_graph(300, 0.05, seed=4),
+    nx.Graph([(0, 0), (0, 1), (1, 2), (2, 0), (2, 3)]),
+    nx.karate_club_graph(),
+], ids=["random", "self-loop", "karate"])
+def test_average_clustering_matches_networkx(graph):
+    assert compute_average_clustering(graph) == pytest.approx(nx.average_clustering(graph), abs=1e-12)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_parallel_betweenness_matches_networkx(monkeypatch, directed):
+    monkeypatch.setattr(Metrics, "PARALLEL_BETWEENNESS_MIN_NODES", 50)
+    graph = nx.gnp_random_graph(120, 0.05, seed=5, directed=directed)
+
+    assert_close(compute_betweenness_centrality(graph, n_jobs=2), nx.betweenness_centrality(graph))
+
+
+def test_connected_components_match_networkx():
+    graph = nx.disjoint_union_all([nx.path_graph(5), nx.complete_graph(3), nx.empty_graph(2)])
+    sizes = sorted((len(c) for c in nx.connected_components(graph)), reverse=True)
+
+    components = calculate_connected_components(graph)
+
+    assert components["num_components"] == len(sizes)
+    assert components["largest_component_size"] == sizes[0]
+    assert components["smallest_component_size"] == sizes[-1]
+    assert components["component_size_distribution"] == sizes
+    assert calculate_connected_components(nx.Graph())["num_components"] == 0
@@ -1,336 +1,211 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
+import matplotlib
+# Batch script that only saves PNGs: use Agg so no GUI backend is probed or imported
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-from scipy import stats
 
 # Set style for academic plots
 plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_context("paper")
-
-# Create a directory for figures if it doesn't exist
-import os
-if not os.path.exists('Figures'):
-    os.makedirs('Figures')
-
-# Load the data
-network_properties = pd.read_csv('network_properties_summary.csv')
-structure_properties = pd.read_csv('results/final_structure_properties.csv')
-
-# Combine the datasets
-data = []
-
-# Get all the unique networks
-networks = network_properties['Network'].unique()
-
-for network in networks:
-    # Get network properties
-    network_row = network_properties[network_properties['Network'] == network].iloc[0]
-    
-    # Get pattern match values for each algorithm
-    be_row = structure_properties[(structure_properties['Network'] == network) & 
-                                (structure_properties['Algorithm'] == 'BE')].iloc[0]
-    
-    rombach_row = structure_properties[(structure_properties['Network'] == network) & 
-                                    (structure_properties['Algorithm'] == 'Rombach')].iloc[0]
-    
-    lowrank_row = structure_properties[(structure_properties['Network'] == network) & 
-                                    (structure_properties['Algorithm'] == 'LowRankCore')].iloc[0]
-    
-    # Add to the dataset
-    data.append({
-        'Network': network,
-        'Nodes (N)': network_row['Nodes (N)'],
-        'Density': network_row['Density'],
-        'Average Degree': network_row['Average Degree'],
-        'Average Clustering Coefficient': network_row['Average Clustering Coefficient'],
-        'Modularity': network_row['Modularity'],
-        'BE Pattern Match': be_row['ideal_pattern_match'],
-        'Rombach Pattern Match': rombach_row['ideal_pattern_match'],
-        'LowRankCore Pattern Match': lowrank_row['ideal_pattern_match']
-    })
-
-# Convert to DataFrame
-df = pd.DataFrame(data)
-
-# Print the dataframe for verification
-print(df)
-
-# Figure 1: Average Degree vs Pattern Match
-plt.figure(figsize=(10, 6))
-
-# Sort by Average Degree for better visualization
-df = df.sort_values('Average Degree')
-
-# Plot each algorithm
-plt.scatter(df['Average Degree'], df['BE Pattern Match'], s=80, marker='o', 
-            label='BE', alpha=0.7, color='#1f77b4')
-plt.scatter(df['Average Degree'], df['Rombach Pattern Match'], s=80, marker='s', 
-            label='Rombach', alpha=0.7, color='#ff7f0e')
-plt.scatter(df['Average Degree'], df['LowRankCore Pattern Match'], s=80, marker='^', 
-            label='LowRankCore (Cucuringu)', alpha=0.7, color='#2ca02c')
-
-# Add network labels next to points (only for BE to avoid clutter)
-for i, row in df.iterrows():
-    plt.annotate(row['Network'], 
-                 xy=(row['Average Degree'], row['BE Pattern Match']),
-                 xytext=(5, 0), textcoords='offset points',
-                 fontsize=8, alpha=0.8)
-
-# Adding horizontal line at y=80 for reference
-plt.axhline(y=80, color='gray', linestyle='--', alpha=0.5)
-
-# Log scale for x-axis due to the wide range of degrees
-plt.xscale('log')
-plt.xlim(df['Average Degree'].min() * 0.8, df['Average Degree'].max() * 1.2)
-plt.ylim(30, 105)  # Ensure y-axis captures all values with some padding
-
-# Add titles and labels
-plt.title('Relationship Between Average Degree and Pattern Match Quality', fontsize=14)
-plt.xlabel('Average Degree (log scale)', fontsize=12)
-plt.ylabel('Pattern Match (%)', fontsize=12)
-plt.legend(fontsize=10)
-plt.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('Figures/avg_degree_vs_pattern_match.png', dpi=300)
-
-# Figure 2: Average Clustering Coefficient vs Pattern Match
-plt.figure(figsize=(10, 6))
-
-# Sort by clustering coefficient for better visualization
-df = df.sort_values('Average Clustering Coefficient')
-
-# Plot each algorithm
-plt.scatter(df['Average Clustering Coefficient'], df['BE Pattern Match'], s=80, 
-            marker='o', label='BE', alpha=0.7, color='#1f77b4')
-plt.scatter(df['Average Clustering Coefficient'], df['Rombach Pattern Match'], s=80, 
-            marker='s', label='Rombach', alpha=0.7, color='#ff7f0e')
-plt.scatter(df['Average Clustering Coefficient'], df['LowRankCore Pattern Match'], s=80, 
-            marker='^', label='LowRankCore (Cucuringu)', alpha=0.7, color='#2ca02c')
-
-# Add network labels
-for i, row in df.iterrows():
-    plt.annotate(row['Network'], 
-                 xy=(row['Average Clustering Coefficient'], row['BE Pattern Match']),
-                 xytext=(5, 0), textcoords='offset points',
-                 fontsize=8, alpha=0.8)
-
-# Adding horizontal line at y=80 for reference
-plt.axhline(y=80, color='gray', linestyle='--', alpha=0.5)
-
-plt.xlim(df['Average Clustering Coefficient'].min() * 0.8, 
-         df['Average Clustering Coefficient'].max() * 1.1)
-plt.ylim(30, 105)  # Ensure y-axis captures all values with some padding
-
-# Add titles and labels
-plt.title('Relationship Between Average Clustering Coefficient and Pattern Match Quality', 
-          fontsize=14)
-plt.xlabel('Average Clustering Coefficient', fontsize=12)
-plt.ylabel('Pattern Match (%)', fontsize=12)
-plt.legend(fontsize=10)
-plt.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('Figures/avg_clustering_vs_pattern_match.png', dpi=300)
-
-# Figure 3: Modularity vs Pattern Match
-plt.figure(figsize=(10, 6))
-
-# Sort by modularity for better visualization
-df = df.sort_values('Modularity')
-
-# Create color scheme similar to the example
-be_color = '#1f77b4'    # Blue
-rombach_color = '#ff7f0e'  # Orange/Yellow
-cucuringu_color = '#2ca02c'  # Green
+# seaborn's "paper" context, set directly so seaborn does not need to be imported
+plt.rcParams.update({
+    'font.size': 9.6, 'axes.labelsize': 9.6, 'axes.titlesize': 9.6,
+    'xtick.labelsize': 8.8, 'ytick.labelsize': 8.8,
+    'legend.fontsize': 8.8, 'legend.title_fontsize': 9.6,
+    'axes.linewidth': 1.0, 'grid.linewidth': 0.8,
+    'lines.linewidth': 1.2, 'lines.markersize': 4.8, 'patch.linewidth': 0.8,
+    'xtick.major.width': 1.0, 'ytick.major.width': 1.0,
+    'xtick.minor.width': 0.8, 'ytick.minor.width': 0.8,
+    'xtick.major.size': 4.8, 'ytick.major.size': 4.8,
+    'xtick.minor.size': 3.2, 'ytick.minor.size': 3.2,
+})
+# Draw long paths in chunks so large scatter/trend batches stay cheap in Agg
+plt.rcParams['agg.path.chunksize'] = 10000
+
+
+# Bump whenever load_properties assembles the table differently, so stale caches are rebuilt
+PROPERTIES_CACHE_VERSION = 1
+
+
+def load_properties():
+    """Assemble one row per network with its properties and each algorithm's pattern match."""
+    # Reuse the assembled table from the last run while the source CSVs are unchanged
+    source_files = ['network_properties_summary.csv', 'results/final_structure_properties.csv']
+    source_mtimes = {path: os.path.getmtime(path) for path in source_files}
+    cache_path = 'Figures/.network_properties_cache.pkl'
+
+    if os.path.exists(cache_path):
+        cached = pd.read_pickle(cache_path)
+        if cached.get('version') == PROPERTIES_CACHE_VERSION and cached.get('mtimes') == source_mtimes:
+            return cached['df']
+
+    # Load the data
+    network_properties = pd.read_csv(
+        'network_properties_summary.csv',
+        usecols=['Network', 'Nodes (N)', 'Density', 'Average Degree',
+                 'Average Clustering Coefficient', 'Modularity'],
+        dtype={'Network': 'category', 'Nodes (N)': 'int32', 'Density': 'float32',
+               'Average Degree': 'float32', 'Average Clustering Coefficient': 'float32',
+               'Modularity': 'float32'}
+    )
+    structure_properties = pd.read_csv(
+        'results/final_structure_properties.csv',
+        usecols=['Network', 'Algorithm', 'ideal_pattern_match'],
+        dtype={'Network': 'category', 'Algorithm': 'category', 'ideal_pattern_match': 'float32'}
+    )
+
+    # Combine the datasets: one row per network with a pattern match column per algorithm
+    # (the first row wins if a network/algorithm pair is listed twice)
+    pattern_match = (
+        structure_properties.drop_duplicates(['Network', 'Algorithm'])
+        .set_index(['Network', 'Algorithm'])['ideal_pattern_match']
+        .unstack('Algorithm')
+        .add_suffix(' Pattern Match')
+    )
+
+    df = network_properties.drop_duplicates('Network').set_index('Network').join(
+        pattern_match[['BE Pattern Match', 'Rombach Pattern Match', 'LowRankCore Pattern Match']],
+        how='inner'
+    ).reset_index()
+
+    pd.to_pickle({'version': PROPERTIES_CACHE_VERSION, 'mtimes': source_mtimes, 'df': df}, cache_path)
+
+    return df
 
-# Plot each algorithm
-plt.scatter(df['Modularity'], df['BE Pattern Match'], s=80, 
-            marker='o', label='BE', alpha=0.7, color=be_color)
-plt.scatter(df['Modularity'], df['Rombach Pattern Match'], s=80, 
-            marker='s', label='Rombach', alpha=0.7, color=rombach_color)
-plt.scatter(df['Modularity'], df['LowRankCore Pattern Match'], s=80, 
-            marker='^', label='Cucuringu', alpha=0.7, color=cucuringu_color)
-
-# Add network labels next to points (only for BE to avoid clutter)
-for i, row in df.iterrows():
-    plt.annotate(row['Network'], 
-                 xy=(row['Modularity'], row['BE Pattern Match']),
-                 xytext=(5, 0), textcoords='offset points',
-                 fontsize=8, alpha=0.8)
-
-# Adding horizontal line at y=80 for reference
-plt.axhline(y=80, color='gray', linestyle='--', alpha=0.5)
-
-# Add trend lines
-# For BE
-slope_be, intercept_be, r_value_be, p_value_be, std_err_be = stats.linregress(
-    df['Modularity'], df['BE Pattern Match'])
-x_be = np.array([df['Modularity'].min(), df['Modularity'].max()])
-y_be = intercept_be + slope_be * x_be
-plt.plot(x_be, y_be, '--', color=be_color, alpha=0.7)
-
-# For Rombach
-slope_rombach, intercept_rombach, r_value_rombach, p_value_rombach, std_err_rombach = stats.linregress(
-    df['Modularity'], df['Rombach Pattern Match'])
-x_rombach = np.array([df['Modularity'].min(), df['Modularity'].max()])
-y_rombach = intercept_rombach + slope_rombach * x_rombach
-plt.plot(x_rombach, y_rombach, '--', color=rombach_color, alpha=0.7)
-
-# For Cucuringu
-slope_cucuringu, intercept_cucuringu, r_value_cucuringu, p_value_cucuringu, std_err_cucuringu = stats.linregress(
-    df['Modularity'], df['LowRankCore Pattern Match'])
-x_cucuringu = np.array([df['Modularity'].min(), df['Modularity'].max()])
-y_cucuringu = intercept_cucuringu + slope_cucuringu * x_cucuringu
-plt.plot(x_cucuringu, y_cucuringu, '--', color=cucuringu_color, alpha=0.7)
-
-plt.xlim(df['Modularity'].min() * 0.95, df['Modularity'].max() * 1.05)
-plt.ylim(30, 105)  # Ensure y-axis captures all values with some padding
-
-# Add titles and labels
-plt.title('Vzťah modularity a Pattern Match (optimálne parametre)', fontsize=14)
-plt.xlabel('Modularita (Louvain)', fontsize=12)
-plt.ylabel('Pattern Match (%)', fontsize=12)
-plt.legend(fontsize=10, title="Algoritmus")
-plt.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('Figures/modularity_vs_pattern_match.png', dpi=300)
-
-# Figure 4: Density vs Pattern Match
-plt.figure(figsize=(10, 6))
-
-# Sort by density for better visualization
-df = df.sort_values('Density')
 
 # Create color scheme
 be_color = '#1f77b4'    # Blue
 rombach_color = '#ff7f0e'  # Orange/Yellow
 cucuringu_color = '#2ca02c'  # Green
 
-# Plot each algorithm
-plt.scatter(df['Density'], df['BE Pattern Match'], s=80, 
-            marker='o', label='BE', alpha=0.7, color=be_color)
-plt.scatter(df['Density'], df['Rombach Pattern Match'], s=80, 
-            marker='s', label='Rombach', alpha=0.7, color=rombach_color)
-plt.scatter(df['Density'], df['LowRankCore Pattern Match'], s=80, 
-            marker='^', label='Cucuringu', alpha=0.7, color=cucuringu_color)
-
-# Add network labels next to points (only for BE to avoid clutter)
-for i, row in df.iterrows():
-    plt.annotate(row['Network'], 
-                 xy=(row['Density'], row['BE Pattern Match']),
-                 xytext=(5, 0), textcoords='offset points',
-                 fontsize=8, alpha=0.8)
-
-# Adding horizontal line at y=80 for reference
-plt.axhline(y=80, color='gray', linestyle='--', alpha=0.5)
-
-# Add trend lines
-# For BE
-slope_be, intercept_be, r_value_be, p_value_be, std_err_be = stats.linregress(
-    df['Density'], df['BE Pattern Match'])
-x_be = np.array([df['Density'].min(), df['Density'].max()])
-y_be = intercept_be + slope_be * x_be
-plt.plot(x_be, y_be, '--', color=be_color, alpha=0.7)
-
-# For Rombach
-slope_rombach, intercept_rombach, r_value_rombach, p_value_rombach, std_err_rombach = stats.linregress(
-    df['Density'], df['Rombach Pattern Match'])
-x_rombach = np.array([df['Density'].min(), df['Density'].max()])
-y_rombach = intercept_rombach + slope_rombach * x_rombach
-plt.plot(x_rombach, y_rombach, '--', color=rombach_color, alpha=0.7)
-
-# For Cucuringu
-slope_cucuringu, intercept_cucuringu, r_value_cucuringu, p_value_cucuringu, std_err_cucuringu = stats.linregress(
-    df['Density'], df['LowRankCore Pattern Match'])
-x_cucuringu = np.array([df['Density'].min(), df['Density'].max()])
-y_cucuringu = intercept_cucuringu + slope_cucuringu * x_cucuringu
-plt.plot(x_cucuringu, y_cucuringu, '--', color=cucuringu_color, alpha=0.7)
-
-# Log scale for x-axis due to the wide range of density values
-plt.xscale('log')
-plt.xlim(df['Density'].min() * 0.5, df['Density'].max() * 2)
-plt.ylim(30, 105)  # Ensure y-axis captures all values with some padding
-
-# Add titles and labels
-plt.title('Vzťah hustoty siete a Pattern Match (optimálne parametre)', fontsize=14)
-plt.xlabel('Hustota siete (log scale)', fontsize=12)
-plt.ylabel('Pattern Match (%)', fontsize=12)
-plt.legend(fontsize=10, title="Algoritmus")
-plt.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('Figures/density_vs_pattern_match.png', dpi=300)
-
-# Figure 5: Network Size (N) vs Pattern Match
-plt.figure(figsize=(10, 6))
-
-# Sort by network size for better visualization
-df = df.sort_values('Nodes (N)')
-
-# Create color scheme
-be_color = '#1f77b4'    # Blue
-rombach_color = '#ff7f0e'  # Orange/Yellow
-cucuringu_color = '#2ca02c'  # Green
 
-# Plot each algorithm
-plt.scatter(df['Nodes (N)'], df['BE Pattern Match'], s=80, 
-            marker='o', label='BE', alpha=0.7, color=be_color)
-plt.scatter(df['Nodes (N)'], df['Rombach Pattern Match'], s=80, 
-            marker='s', label='Rombach', alpha=0.7, color=rombach_color)
-plt.scatter(df['Nodes (N)'], df['LowRankCore Pattern Match'], s=80, 
-            marker='^', label='Cucuringu', alpha=0.7, color=cucuringu_color)
-
-# Add network labels next to points (only for BE to avoid clutter)
-for i, row in df.iterrows():
-    plt.annotate(row['Network'], 
-                 xy=(row['Nodes (N)'], row['BE Pattern Match']),
-                 xytext=(5, 0), textcoords='offset points',
-                 fontsize=8, alpha=0.8)
-
-# Adding horizontal line at y=80 for reference
-plt.axhline(y=80, color='gray', linestyle='--', alpha=0.5)
-
-# Add trend lines
-# For BE
-slope_be, intercept_be, r_value_be, p_value_be, std_err_be = stats.linregress(
-    np.log10(df['Nodes (N)']), df['BE Pattern Match'])  # Using log scale for fit
-x_be_log = np.array([np.log10(df['Nodes (N)'].min()), np.log10(df['Nodes (N)'].max())])
-y_be = intercept_be + slope_be * x_be_log
-x_be = 10 ** x_be_log  # Convert back to original scale for plotting
-plt.plot(x_be, y_be, '--', color=be_color, alpha=0.7)
-
-# For Rombach
-slope_rombach, intercept_rombach, r_value_rombach, p_value_rombach, std_err_rombach = stats.linregress(
-    np.log10(df['Nodes (N)']), df['Rombach Pattern Match'])  # Using log scale for fit
-x_rombach_log = np.array([np.log10(df['Nodes (N)'].min()), np.log10(df['Nodes (N)'].max())])
-y_rombach = intercept_rombach + slope_rombach * x_rombach_log
-x_rombach = 10 ** x_rombach_log  # Convert back to original scale for plotting
-plt.plot(x_rombach, y_rombach, '--', color=rombach_color, alpha=0.7)
-
-# For Cucuringu
-slope_cucuringu, intercept_cucuringu, r_value_cucuringu, p_value_cucuringu, std_err_cucuringu = stats.linregress(
-    np.log10(df['Nodes (N)']), df['LowRankCore Pattern Match'])  # Using log scale for fit
-x_cucuringu_log = np.array([np.log10(df['Nodes (N)'].min()), np.log10(df['Nodes (N)'].max())])
-y_cucuringu = intercept_cucuringu + slope_cucuringu * x_cucuringu_log
-x_cucuringu = 10 ** x_cucuringu_log  # Convert back to original scale for plotting
-plt.plot(x_cucuringu, y_cucuringu, '--', color=cucuringu_color, alpha=0.7)
-
-# Log scale for x-axis due to the wide range of network sizes
-plt.xscale('log')
-plt.xlim(df['Nodes (N)'].min() * 0.8, df['Nodes (N)'].max() * 1.2)
-plt.ylim(30, 105)  # Ensure y-axis captures all values with some padding
-
-# Add titles and labels
-plt.title('Vzťah veľkosti siete a Pattern Match (optimálne parametre)', fontsize=14)
-plt.xlabel('Počet uzlov N (log scale)', fontsize=12)
-plt.ylabel('Pattern Match (%)', fontsize=12)
-plt.legend(fontsize=10, title="Algoritmus")
-plt.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('Figures/network_size_vs_pattern_match.png', dpi=300)
-
-print("Visualizations have been saved to the 'Figures' directory.") 
\ No newline at end of file
+def fit_all(x, Y):
+    """Least-squares lines of every column of Y against x; returns (slopes, intercepts)."""
+    return np.polyfit(np.asarray(x, dtype=np.float64), np.asarray(Y, dtype=np.float64), 1)
+
+
+def plot_vs(cols, xcol, xlabel, title, fname, logx=False, trendlines=False, fit_col=None,
+            xlim_pad=(0.8, 1.2), cucuringu_label='Cucuringu', legend_title=None):
+    """Plot the pattern match of all three algorithms against one network property."""
+    fig = plt.figure(figsize=(10, 6))
+
+    # Sort by the x property for better visualization
+    order = np.argsort(cols[xcol])
+
+    algorithms = [
+        ('BE Pattern Match', 'BE', 'o', be_color),
+        ('Rombach Pattern Match', 'Rombach', 's', rombach_color),
+        ('LowRankCore Pattern Match', cucuringu_label, '^', cucuringu_color),
+    ]
+
+    x_arr = cols[xcol][order]
+    y_arrs = {ycol: cols[ycol][order] for ycol, *_ in algorithms}
+    # x_arr is sorted, so its ends are the range used for the trend lines and limits
+    xmin, xmax = x_arr[0], x_arr[-1]
+
+    # Plot each algorithm; plot() markers take matplotlib's fast path for constant size and color
+    for ycol, label, marker, color in algorithms:
+        plt.plot(x_arr, y_arrs[ycol], linestyle='', marker=marker, markersize=np.sqrt(80),
+                 label=label, alpha=0.7, color=color, rasterized=True)
+
+    # Add network labels next to points (only for BE to avoid clutter)
+    for name, xv, yv in zip(cols['Network'][order], x_arr, y_arrs['BE Pattern Match']):
+        plt.annotate(name,
+                     xy=(xv, yv),
+                     xytext=(5, 0), textcoords='offset points',
+                     fontsize=8, alpha=0.8)
+
+    # Adding horizontal line at y=80 for reference
+    plt.axhline(y=80, color='gray', linestyle='--', alpha=0.5)
+
+    # Add trend lines, fitted against the precomputed log10(x) column (fit_col) on log-scale axes
+    if trendlines:
+        if fit_col is not None:
+            x_values = cols[fit_col][order]
+            x_fit = x_values[[0, -1]]
+            x_line = 10 ** x_fit  # Convert back to original scale for plotting
+        else:
+            x_values = x_arr
+            x_fit = np.array([xmin, xmax])
+            x_line = x_fit
+        slopes, intercepts = fit_all(x_values, np.column_stack(list(y_arrs.values())))
+        for (ycol, label, marker, color), slope, intercept in zip(algorithms, slopes, intercepts):
+            plt.plot(x_line, intercept + slope * x_fit, '--', color=color, alpha=0.7)
+
+    # Log scale for x-axis for properties with a wide range of values
+    if logx:
+        plt.xscale('log')
+    plt.xlim(xmin * xlim_pad[0], xmax * xlim_pad[1])
+    plt.ylim(30, 105)  # Ensure y-axis captures all values with some padding
+
+    # Add titles and labels
+    plt.title(title, fontsize=14)
+    plt.xlabel(xlabel, fontsize=12)
+    plt.ylabel('Pattern Match (%)', fontsize=12)
+    plt.legend(fontsize=10, title=legend_title)
+    plt.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(fname, dpi=300)
+    plt.close(fig)
+    return fname
+
+
+# plot_vs arguments for each figure, after the column arrays
+FIGURES = [
+    # Figure 1: Average Degree vs Pattern Match
+    (('Average Degree', 'Average Degree (log scale)',
+      'Relationship Between Average Degree and Pattern Match Quality',
+      'Figures/avg_degree_vs_pattern_match.png'),
+     dict(logx=True, cucuringu_label='LowRankCore (Cucuringu)')),
+    # Figure 2: Average Clustering Coefficient vs Pattern Match
+    (('Average Clustering Coefficient', 'Average Clustering Coefficient',
+      'Relationship Between Average Clustering Coefficient and Pattern Match Quality',
+      'Figures/avg_clustering_vs_pattern_match.png'),
+     dict(xlim_pad=(0.8, 1.1), cucuringu_label='LowRankCore (Cucuringu)')),
+    # Figure 3: Modularity vs Pattern Match
+    (('Modularity', 'Modularita (Louvain)',
+      'Vzťah modularity a Pattern Match (optimálne parametre)',
+      'Figures/modularity_vs_pattern_match.png'),
+     dict(trendlines=True, xlim_pad=(0.95, 1.05), legend_title="Algoritmus")),
+    # Figure 4: Density vs Pattern Match
+    (('Density', 'Hustota siete (log scale)',
+      'Vzťah hustoty siete a Pattern Match (optimálne parametre)',
+      'Figures/density_vs_pattern_match.png'),
+     dict(logx=True, trendlines=True, fit_col='_log_Density', xlim_pad=(0.5, 2),
+          legend_title="Algoritmus")),
+    # Figure 5: Network Size (N) vs Pattern Match
+    (('Nodes (N)', 'Počet uzlov N (log scale)',
+      'Vzťah veľkosti siete a Pattern Match (optimálne parametre)',
+      'Figures/network_size_vs_pattern_match.png'),
+     dict(logx=True, trendlines=True, fit_col='_log_Nodes (N)', legend_title="Algoritmus")),
+]
+
+
+if __name__ == '__main__':
+    # Create a directory for figures if it doesn't exist
+    os.makedirs('Figures', exist_ok=True)
+
+    df = load_properties()
+
+    # Print the dataframe for verification when VERBOSE is set
+    if os.environ.get('VERBOSE'):
+        print(df.to_string())
+
+    # log10 of the log-scale properties, shared by every trend-line fit on them
+    for col in ('Density', 'Nodes (N)'):
+        df[f'_log_{col}'] = np.log10(df[col])
+
+    # Plain column arrays shared by every figure; each figure only computes its sort order
+    cols = {col: df[col].to_numpy() for col in df.columns}
+
+    # The figures are independent, so each one renders and encodes its PNG in its own process
+    with ProcessPoolExecutor(max_workers=len(FIGURES)) as executor:
+        futures = [executor.submit(plot_vs, cols, *args, **kwargs) for args, kwargs in FIGURES]
+        for future in futures:
+            future.result()
+
+    print("Visualizations have been saved to the 'Figures' directory.")